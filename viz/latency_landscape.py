@@ -67,27 +67,31 @@ def create_latency_surface(data: dict, plotter: pv.Plotter) -> None:
     
     samples = data.get('samples', [])
     if len(samples) < 100:
-        samples = np.random.exponential(1000, 1000).tolist()
+        samples = np.random.exponential(1000, 1000)
     
-    # Reshape samples into 2D grid for surface
+    # Reshape samples into 2D grid for surface (np.array copies, so the
+    # in-place normalization below leaves the caller's samples untouched)
     n = int(np.sqrt(len(samples)))
-    grid_data = np.array(samples[:n*n]).reshape(n, n)
+    grid_data = np.array(samples[:n*n], dtype=np.float32).reshape(n, n)
     
     # Normalize for visualization
-    grid_data = np.log1p(grid_data)  # Log scale for better visualization
-    grid_data = (grid_data / grid_data.max()) * 30
+    np.log1p(grid_data, out=grid_data)  # Log scale for better visualization
+    grid_data *= 30.0 / grid_data.max()
     
     # Create coordinate grid
-    x = np.linspace(0, 100, n)
-    y = np.linspace(0, 100, n)
+    x = np.linspace(0, 100, n, dtype=np.float32)
+    y = np.linspace(0, 100, n, dtype=np.float32)
     X, Y = np.meshgrid(x, y)
     
     # Create surface
-    points = np.column_stack([X.ravel(), Y.ravel(), grid_data.ravel()])
+    points = np.empty((n * n, 3), dtype=np.float32)
+    points[:, 0] = X.reshape(-1)
+    points[:, 1] = Y.reshape(-1)
+    points[:, 2] = grid_data.reshape(-1)
     grid = pv.StructuredGrid()
     grid.points = points
     grid.dimensions = [n, n, 1]
-    grid.point_data['latency'] = grid_data.ravel()
+    grid.point_data['latency'] = grid_data.reshape(-1)
     
     plotter.add_mesh(
         grid,
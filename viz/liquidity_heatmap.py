@@ -31,32 +31,49 @@ def create_liquidity_heatmap(
     data: np.ndarray,
     frame: int,
     plotter: pv.Plotter
-) -> None:
+) -> pv.StructuredGrid:
     """Create 3D liquidity heatmap for a single frame."""
     
     frame_data = data[frame]
     n_y, n_x = frame_data.shape
     
     # Create coordinate grids
-    x = np.linspace(0, 100, n_x)
-    y = np.linspace(0, 100, n_y)
+    x = np.linspace(0, 100, n_x, dtype=np.float32)
+    y = np.linspace(0, 100, n_y, dtype=np.float32)
     X, Y = np.meshgrid(x, y)
     
-    # Scale Z by liquidity value
-    Z = frame_data * 30  # Scale for visibility
-    
-    # Create surface
-    points = np.column_stack([X.ravel(), Y.ravel(), Z.ravel()])
+    # Create surface, scaling Z by liquidity value for visibility
+    points = np.empty((n_x * n_y, 3), dtype=np.float32)
+    points[:, 0] = X.ravel()
+    points[:, 1] = Y.ravel()
+    points[:, 2] = frame_data.ravel() * 30
     grid = pv.StructuredGrid()
     grid.points = points
     grid.dimensions = [n_x, n_y, 1]
     
-    # Add scalar values for coloring
-    grid.point_data['liquidity'] = frame_data.ravel()
+    # Add scalar values for coloring. PyVista wraps contiguous arrays without
+    # copying, and update_liquidity_heatmap writes into this buffer, so copy
+    # it to keep later frames from overwriting the caller's data[frame]
+    grid.point_data['liquidity'] = frame_data.ravel().copy()
     
     return grid
 
 
+def update_liquidity_heatmap(
+    grid: pv.StructuredGrid,
+    data: np.ndarray,
+    frame: int
+) -> None:
+    """Overwrite heights and scalars of an existing heatmap grid in place."""
+    
+    frame_data = data[frame].ravel()
+    
+    # Topology and X/Y are fixed, only Z and the scalars change per frame
+    grid.points[:, 2] = frame_data * 30
+    grid.GetPoints().Modified()
+    grid.point_data['liquidity'][:] = frame_data
+
+
 def main():
     parser = argparse.ArgumentParser(description='3D Liquidity Heatmap Visualization')
     parser.add_argument('--input', type=str, help='Input data file')
@@ -103,10 +120,12 @@ def main():
         print(f"Rendering animation to {args.export}...")
         plotter.open_movie(args.export, framerate=15)
         
+        # Render straight from the cached grid so in-place updates show up
+        actor.mapper.SetInputData(grid)
+        
         for i in range(data.shape[0]):
             # Update mesh
-            new_grid = create_liquidity_heatmap(data, i, plotter)
-            actor.mapper.SetInputData(new_grid)
+            update_liquidity_heatmap(grid, data, i)
             plotter.camera.azimuth += 360 / data.shape[0]
             plotter.write_frame()
         
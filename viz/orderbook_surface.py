@@ -34,34 +34,44 @@ def create_orderbook_surface(
     ask_depth: np.ndarray,
     plotter: pv.Plotter
 ) -> None:
-    """Create 3D order book surface visualization."""
+    """
+    Create 3D order book surface visualization.
     
-    # Create meshgrid for surface
-    T, P = np.meshgrid(times, prices)
+    prices and times must be sorted ascending; their first and last
+    entries are taken as the axis extremes when normalizing.
+    """
     
-    # Normalize for visualization
-    price_norm = (P - P.min()) / (P.max() - P.min()) * 100
-    time_norm = T / T.max() * 100
+    n_prices, n_times = len(prices), len(times)
     
-    # Create bid surface (green)
-    bid_points = np.column_stack([
-        time_norm.ravel(),
-        price_norm.ravel(),
-        (bid_depth * 20).ravel()  # Scale for visibility
-    ])
+    # Normalize for visualization; prices and times are sorted, so the
+    # extremes are the end points and the normalization stays 1D
+    pmin, pmax = float(prices[0]), float(prices[-1])
+    tmax = float(times[-1])
+    # A single price level or time column has no range; collapse it to 0
+    price_scale = 100.0 / (pmax - pmin) if pmax != pmin else 0.0
+    time_scale = 100.0 / tmax if tmax != 0 else 0.0
+    price_norm = (prices - pmin) * price_scale
+    time_norm = times * time_scale
+    
+    # Create bid surface (green), filling point columns in place
+    bid_points = np.empty((n_prices * n_times, 3), dtype=np.float32)
+    bid_cells = bid_points.reshape(n_prices, n_times, 3)
+    bid_cells[:, :, 0] = time_norm[None, :]
+    bid_cells[:, :, 1] = price_norm[:, None]
+    bid_points[:, 2] = bid_depth.reshape(-1)
+    bid_points[:, 2] *= 20  # Scale for visibility
     bid_grid = pv.StructuredGrid()
     bid_grid.points = bid_points
-    bid_grid.dimensions = [len(times), len(prices), 1]
+    bid_grid.dimensions = [n_times, n_prices, 1]
     
-    # Create ask surface (red)
-    ask_points = np.column_stack([
-        time_norm.ravel(),
-        price_norm.ravel(),
-        (ask_depth * 20).ravel()
-    ])
+    # Create ask surface (red), sharing the X/Y columns
+    ask_points = np.empty_like(bid_points)
+    ask_points[:, :2] = bid_points[:, :2]
+    ask_points[:, 2] = ask_depth.reshape(-1)
+    ask_points[:, 2] *= 20
     ask_grid = pv.StructuredGrid()
     ask_grid.points = ask_points
-    ask_grid.dimensions = [len(times), len(prices), 1]
+    ask_grid.dimensions = [n_times, n_prices, 1]
     
     # Add surfaces to plotter with Inferno cmap
     plotter.add_mesh(
@@ -84,8 +94,7 @@ def create_orderbook_surface(
     )
     
     # Add mid-price plane
-    mid_idx = len(prices) // 2
-    mid_price_norm = (prices[mid_idx] - prices.min()) / (prices.max() - prices.min()) * 100
+    mid_price_norm = float(price_norm[n_prices // 2])
     plane = pv.Plane(
         center=(50, mid_price_norm, 5),
         direction=(0, 1, 0),
@@ -153,10 +162,10 @@ def main():
     # Show or close
     if not args.no_display:
         if args.rotate:
-            plotter.open_gif("orderbook_rotation.gif") if args.export and args.export.endswith('.gif') else None
-            for angle in range(0, 360, 2):
-                plotter.camera.azimuth = angle
-                plotter.render()
+            write_gif = bool(args.export) and args.export.endswith('.gif')
+            plotter.open_gif("orderbook_rotation.gif") if write_gif else None
+            path = plotter.generate_orbital_path(n_points=180, shift=50)
+            plotter.orbit_on_path(path, write_frames=write_gif, step=1 / 60)
         plotter.show()
     else:
         plotter.close()